@@ -25,7 +25,9 @@ class DatabaseHelper:
 
     def __init__(self) -> None:
         from isisdl.utils import path
-        self.con = sqlite3.connect(path(database_file_location), check_same_thread=False)
+        # ":memory:" has to be passed verbatim, otherwise sqlite would create a file of that name in the working dir.
+        database_location = database_file_location if database_file_location == ":memory:" else str(path(database_file_location))
+        self.con = sqlite3.connect(database_location, check_same_thread=False)
         self.cur = self.con.cursor()
         self.create_default_tables()
 
@@ -42,6 +44,11 @@ class DatabaseHelper:
                 (name text, url text, download_url text, location text, time int, course_id int, media_type int, size int, checksum text, UNIQUE(url, course_id) ON CONFLICT REPLACE)
             """)
 
+            # Without this index `find_file_by_checksum` is a full-table scan, which gets expensive once many files have been downloaded.
+            self.cur.execute("""
+                CREATE INDEX IF NOT EXISTS checksum_course_id_index ON fileinfo (checksum, course_id)
+            """)
+
             self.cur.execute("""
                 CREATE TABLE IF NOT EXISTS json_strings
                 (id text primary key unique, json text)
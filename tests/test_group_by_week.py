@@ -1,148 +1,76 @@
 """Tests for the group by week feature."""
-from unittest.mock import MagicMock
+import functools
+from pathlib import Path
+from typing import List
+from unittest.mock import Mock
 
 import pytest
 
 from isisdl.backend.request_helper import PreMediaContainer, Course
 from isisdl.utils import MediaType, config, path, sanitize_name
 
+# sanitize_name depends on `config.filename_replacing`, so it cannot be cached globally.
+# The config is stable within this module, so memoizing the repeated identical calls here is safe.
+_san = functools.lru_cache(maxsize=None)(sanitize_name)
 
-@pytest.fixture
+# The sanitized directory names are invariant, so compute them once at import time.
+# The full expected paths cannot be precomputed: `path()` is rooted in a per-test tmp_path.
+COURSE_DIR = _san("Test Course", True)
+WEEK_DIRS = {
+    week_name: _san(week_name, True)
+    for week_name in (
+        "Week 1 - Introduction", "Week 2 - Data Structures", "Week 3 - Algorithms",
+        "Week 1: Introduction / Overview", "Week 4 - Testing", "Week 5 - Final Project",
+    )
+}
+
+
+@pytest.fixture(scope="module")
 def mock_course() -> Course:
-    """Create a mock course for testing."""
-    course = MagicMock(spec=Course)
+    """Create a mock course for testing. The tests only call `course.path(...)`, so one instance can be shared."""
+    course = Mock(spec_set=Course)
     course.course_id = "12345"
     course.name = "Test Course"
-    course.path = lambda *args: path(sanitize_name("Test Course", True), *args)
+    course.path = functools.partial(path, COURSE_DIR)
     return course
 
 
 @pytest.fixture(autouse=True)
-def setup_config():
-    """Setup and teardown for config state."""
-    original_make_subdirs = config.make_subdirs
-    yield
-    config.make_subdirs = original_make_subdirs
+def redirect_path_to_tmp(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Redirect `path()` to a fresh temporary directory, so the `.mkdir()` in PreMediaContainer never touches the real download dir."""
+    monkeypatch.setattr("isisdl.utils.working_dir_location", str(tmp_path))
 
 
 class TestPreMediaContainerWeekFeature:
     """Tests for PreMediaContainer with week_name parameter."""
 
-    def test_week_name_with_subdirs_enabled(self, mock_course: Course) -> None:
-        """Test that week_name creates correct path when subdirs are enabled."""
-        config.make_subdirs = True
-
-        container = PreMediaContainer(
-            url="https://example.com/file.pdf",
-            course=mock_course,
-            media_type=MediaType.document,
-            name="test_file.pdf",
-            week_name="Week 1 - Introduction"
-        )
-
-        # Week name should be sanitized and used as parent path
-        expected_path = path(sanitize_name("Test Course", True), sanitize_name("Week 1 - Introduction", True))
-        assert container.parent_path == expected_path
-        assert container.parent_path.exists()
-
-    def test_week_name_with_subdirs_disabled(self, mock_course: Course) -> None:
-        """Test that week_name is ignored when subdirs are disabled."""
-        config.make_subdirs = False
-
-        container = PreMediaContainer(
-            url="https://example.com/file.pdf",
-            course=mock_course,
-            media_type=MediaType.document,
-            name="test_file.pdf",
-            week_name="Week 1 - Introduction"
-        )
-
-        # With subdirs disabled, files should go directly in course root
-        expected_path = path(sanitize_name("Test Course", True))
-        assert container.parent_path == expected_path
-
-    def test_no_week_name_uses_media_type_dir(self, mock_course: Course) -> None:
-        """Test that without week_name, media type directory is used (or course root for documents)."""
-        config.make_subdirs = True
+    @pytest.mark.parametrize("week_name,media_type,make_subdirs,expected_segments", [
+        pytest.param("Week 1 - Introduction", MediaType.document, True, ["Week 1 - Introduction"], id="subdirs_enabled"),
+        pytest.param("Week 1 - Introduction", MediaType.document, False, [], id="subdirs_disabled"),
+        pytest.param(None, MediaType.document, True, [], id="no_week_name"),
+        pytest.param("", MediaType.document, True, [], id="empty_week_name"),
+        pytest.param("Week 2 - Data Structures", MediaType.video, True, ["Week 2 - Data Structures"], id="video_media_type"),
+        pytest.param("Week 3 - Algorithms", MediaType.extern, True, ["Week 3 - Algorithms"], id="extern_media_type"),
+        pytest.param("Week 1: Introduction / Overview", MediaType.document, True, ["Week 1: Introduction / Overview"], id="sanitization"),
+    ])
+    def test_week_name_parent_path(self, mock_course: Course, week_name: str, media_type: MediaType, make_subdirs: bool, expected_segments: List[str], monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that week_name, media_type and make_subdirs produce the correct parent path."""
+        monkeypatch.setattr(config, "make_subdirs", make_subdirs)
 
         container = PreMediaContainer(
             url="https://example.com/file.pdf",
             course=mock_course,
-            media_type=MediaType.document,
+            media_type=media_type,
             name="test_file.pdf",
-            week_name=None
-        )
-
-        # Documents without a week go to course root (dir_name is empty string)
-        expected_path = path(sanitize_name("Test Course", True))
-        assert container.parent_path == expected_path
-
-    def test_empty_week_name_uses_media_type_dir(self, mock_course: Course) -> None:
-        """Test that empty week_name falls back to media type directory (or course root for documents)."""
-        config.make_subdirs = True
-
-        container = PreMediaContainer(
-            url="https://example.com/file.pdf",
-            course=mock_course,
-            media_type=MediaType.document,
-            name="test_file.pdf",
-            week_name=""
-        )
-
-        # Empty string should be treated as no week - documents go to course root
-        expected_path = path(sanitize_name("Test Course", True))
-        assert container.parent_path == expected_path
-
-    def test_week_name_with_video_media_type(self, mock_course: Course) -> None:
-        """Test week grouping with video media type."""
-        config.make_subdirs = True
-
-        container = PreMediaContainer(
-            url="https://example.com/video.mp4",
-            course=mock_course,
-            media_type=MediaType.video,
-            name="lecture.mp4",
-            week_name="Week 2 - Data Structures"
-        )
-
-        expected_path = path(sanitize_name("Test Course", True), sanitize_name("Week 2 - Data Structures", True))
-        assert container.parent_path == expected_path
-
-    def test_week_name_with_extern_media_type(self, mock_course: Course) -> None:
-        """Test week grouping with external links."""
-        config.make_subdirs = True
-
-        container = PreMediaContainer(
-            url="https://external-site.com/resource",
-            course=mock_course,
-            media_type=MediaType.extern,
-            week_name="Week 3 - Algorithms"
-        )
-
-        expected_path = path(sanitize_name("Test Course", True), sanitize_name("Week 3 - Algorithms", True))
-        assert container.parent_path == expected_path
-
-    def test_week_name_sanitization(self, mock_course: Course) -> None:
-        """Test that week names with special characters are sanitized."""
-        config.make_subdirs = True
-
-        container = PreMediaContainer(
-            url="https://example.com/file.pdf",
-            course=mock_course,
-            media_type=MediaType.document,
-            name="test.pdf",
-            week_name="Week 1: Introduction / Overview"
+            week_name=week_name
         )
 
-        # Week name should be sanitized (special chars removed/replaced)
-        expected_path = path(sanitize_name("Test Course", True), sanitize_name("Week 1: Introduction / Overview", True))
+        expected_path = path(COURSE_DIR, *[WEEK_DIRS[segment] for segment in expected_segments])
         assert container.parent_path == expected_path
-        # Verify the path was created
-        assert container.parent_path.exists()
 
-    def test_week_name_with_relative_location(self, mock_course: Course) -> None:
+    def test_week_name_with_relative_location(self, mock_course: Course, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test that week_name takes precedence over relative_location."""
-        config.make_subdirs = True
+        monkeypatch.setattr(config, "make_subdirs", True)
 
         container = PreMediaContainer(
             url="https://example.com/file.pdf",
@@ -154,12 +82,12 @@ class TestPreMediaContainerWeekFeature:
         )
 
         # Week name should take precedence
-        expected_path = path(sanitize_name("Test Course", True), sanitize_name("Week 4 - Testing", True))
+        expected_path = path(COURSE_DIR, WEEK_DIRS["Week 4 - Testing"])
         assert container.parent_path == expected_path
 
-    def test_multiple_files_same_week(self, mock_course: Course) -> None:
+    def test_multiple_files_same_week(self, mock_course: Course, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test that multiple files in the same week share parent path."""
-        config.make_subdirs = True
+        monkeypatch.setattr(config, "make_subdirs", True)
         week_name = "Week 5 - Final Project"
 
         container1 = PreMediaContainer(
@@ -179,13 +107,12 @@ class TestPreMediaContainerWeekFeature:
         )
 
         # Both should have the same parent path
-        assert container1.parent_path == container2.parent_path
-        expected_path = path(sanitize_name("Test Course", True), sanitize_name(week_name, True))
-        assert container1.parent_path == expected_path
+        expected_path = path(COURSE_DIR, WEEK_DIRS[week_name])
+        assert container1.parent_path == container2.parent_path == expected_path
 
-    def test_different_weeks_different_paths(self, mock_course: Course) -> None:
+    def test_different_weeks_different_paths(self, mock_course: Course, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test that files from different weeks have different parent paths."""
-        config.make_subdirs = True
+        monkeypatch.setattr(config, "make_subdirs", True)
 
         container1 = PreMediaContainer(
             url="https://example.com/file1.pdf",
@@ -204,9 +131,9 @@ class TestPreMediaContainerWeekFeature:
         # Different weeks should have different parent paths
         assert container1.parent_path != container2.parent_path
 
-    def test_parent_path_directory_creation(self, mock_course: Course) -> None:
+    def test_parent_path_directory_creation(self, mock_course: Course, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test that parent_path directories are created automatically."""
-        config.make_subdirs = True
+        monkeypatch.setattr(config, "make_subdirs", True)
         week_name = "Week 6 - New Topic"
 
         container = PreMediaContainer(
@@ -1,33 +1,44 @@
 """Test hash-based file matching for renamed files."""
-import os
-import tempfile
-from pathlib import Path
+from typing import Any
+from unittest.mock import patch
 
 import pytest
 
 from isisdl.backend.database_helper import DatabaseHelper
 
 
-def test_find_file_by_checksum_returns_none_when_not_found():
-    """Test that find_file_by_checksum returns None when no file is found."""
-    db = DatabaseHelper()
-    result = db.find_file_by_checksum('nonexistent_checksum', 999)
-    assert result is None
+@pytest.fixture(scope="module")
+def database_helper() -> Any:
+    """Override the session-scoped fixture with an in-memory database.
+
+    These tests only read from an empty table, so there is no need to touch the on-disk database.
+    """
+    with patch("isisdl.backend.database_helper.database_file_location", ":memory:"):
+        helper = DatabaseHelper()
+
+    yield helper
+
+    helper.close_connection()
 
 
-def test_find_file_by_checksum_basic_functionality():
-    """Test the basic functionality of find_file_by_checksum method.
-    
-    This test verifies that the new find_file_by_checksum method can be called
-    without errors, which is essential for hash-based file matching.
+@pytest.mark.parametrize("checksum,course_id", [
+    ("nonexistent_checksum", 999),
+    ("test_checksum_123", 999),
+    ("another_checksum", 123),
+])
+def test_find_file_by_checksum_returns_none_when_not_found(database_helper: DatabaseHelper, checksum: str, course_id: int) -> None:
+    """Test that find_file_by_checksum returns None when no file is found.
+
+    This also verifies that the method can be called without errors, which is
+    essential for hash-based file matching.
     """
-    db = DatabaseHelper()
-    
-    # Test with non-existent checksum
-    result = db.find_file_by_checksum('test_checksum_123', 999)
-    assert result is None
-    
-    # Test with different course IDs
-    result = db.find_file_by_checksum('another_checksum', 123)
-    assert result is None
+    assert database_helper.find_file_by_checksum(checksum, course_id) is None
+
+
+def test_find_file_by_checksum_uses_index(database_helper: DatabaseHelper) -> None:
+    """Test that the checksum lookup uses the index instead of scanning the whole table."""
+    plan = database_helper.cur.execute("""
+        EXPLAIN QUERY PLAN SELECT * FROM fileinfo WHERE checksum = ? AND course_id = ?
+    """, ("some_checksum", 42)).fetchall()
 
+    assert "USING INDEX checksum_course_id_index" in plan[0][3]